@@ -12,8 +12,10 @@ import pytest
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ObjectDoesNotExist
+from django.db import connection
 from django.http import QueryDict
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django_dynamic_fixture import get as get_model_fixture
 from edx_rest_framework_extensions.auth.jwt.cookies import jwt_cookie_name
@@ -242,6 +244,16 @@ def _learner_license_detail_request(api_client, subscription_uuid):
     return api_client.get(url)
 
 
+def _get_num_queries(make_request):
+    """
+    Helper method that makes a request and returns the number of queries it took, after asserting it succeeded.
+    """
+    with CaptureQueriesContext(connection) as captured_queries:
+        response = make_request()
+    assert status.HTTP_200_OK == response.status_code
+    return len(captured_queries)
+
+
 def _iso_8601_format(datetime):
     """
     Helper to return an ISO8601-formatted datetime string, with a trailing 'Z'.
@@ -391,6 +403,28 @@ def test_customer_agreement_list_superuser_200(api_client, superuser):
     _assert_customer_agreement_response_correct(response.data['results'][0], customer_agreement)
 
 
+@pytest.mark.django_db
+def test_customer_agreement_list_num_queries(api_client, superuser):
+    """
+    Verify that the number of queries made by the customer agreement list endpoint doesn't grow with the number of
+    subscription plans serialized.
+    """
+    enterprise_customer_uuid = uuid4()
+    _, _, customer_agreement = _create_subscription_plans(enterprise_customer_uuid)
+
+    def make_request():
+        return _customer_agreement_list_request(api_client, superuser, enterprise_customer_uuid)
+
+    # Make a first request so that anything cached per process doesn't count towards the later requests
+    make_request()
+    num_queries = _get_num_queries(make_request)
+
+    for subscription_plan in SubscriptionPlanFactory.create_batch(3, customer_agreement=customer_agreement):
+        LicenseFactory.create_batch(2, subscription_plan=subscription_plan, status=constants.ASSIGNED)
+        SubscriptionPlanRenewalFactory.create(prior_subscription_plan=subscription_plan)
+    assert _get_num_queries(make_request) == num_queries
+
+
 @pytest.mark.django_db
 def test_customer_agreement_list_non_staff_user_200(api_client, non_staff_user, user_role, boolean_toggle):
     """
@@ -568,6 +602,34 @@ def test_subscription_plan_list_superuser_200(api_client, superuser):
     assert len(results) == 10
 
 
+@pytest.mark.django_db
+def test_subscription_plan_list_num_queries(api_client, superuser):
+    """
+    Verify that the number of queries made by the subscription list endpoint doesn't grow with the number of
+    subscription plans listed.
+    """
+    enterprise_customer_uuid = uuid4()
+    _, _, customer_agreement = _create_subscription_plans(enterprise_customer_uuid)
+
+    def make_request():
+        return _subscriptions_list_request(api_client, superuser, enterprise_customer_uuid=enterprise_customer_uuid)
+
+    # Make a first request so that anything cached per process doesn't count towards the later requests
+    make_request()
+    num_queries = _get_num_queries(make_request)
+
+    for subscription_plan in SubscriptionPlanFactory.create_batch(
+        3,
+        customer_agreement=customer_agreement,
+        is_active=True,
+    ):
+        LicenseFactory.create_batch(2, subscription_plan=subscription_plan, status=constants.ASSIGNED)
+        SubscriptionPlanRenewalFactory.create(prior_subscription_plan=subscription_plan)
+    response = make_request()
+    assert len(response.data['results']) == 5
+    assert _get_num_queries(make_request) == num_queries
+
+
 @pytest.mark.django_db
 def test_subscription_plan_list_bad_enterprise_uuid_400(api_client, superuser):
     """
@@ -705,6 +767,32 @@ def test_license_list_staff_user_200_custom_page_size(api_client, staff_user):
     assert response.data['next'] is not None
 
 
+@pytest.mark.django_db
+def test_license_list_num_queries(api_client, staff_user):
+    """
+    Verify that the number of queries made by the license list endpoint doesn't grow with the number of licenses
+    listed.
+    """
+    subscription, _, _ = _subscription_and_licenses()
+    _assign_role_via_jwt_or_db(
+        api_client,
+        staff_user,
+        subscription.enterprise_customer_uuid,
+        True,
+    )
+
+    def make_request():
+        return _licenses_list_request(api_client, subscription.uuid)
+
+    # Make a first request so that anything cached per process doesn't count towards the later requests
+    make_request()
+    num_queries = _get_num_queries(make_request)
+
+    LicenseFactory.create_batch(5, subscription_plan=subscription, status=constants.ASSIGNED)
+    assert make_request().data['count'] == 7
+    assert _get_num_queries(make_request) == num_queries
+
+
 @pytest.mark.django_db
 def test_license_detail_staff_user_200(api_client, staff_user, boolean_toggle):
     subscription = SubscriptionPlanFactory.create()
@@ -6,7 +6,8 @@ from uuid import uuid4
 from celery import chain
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ObjectDoesNotExist
-from django.db.models import Count
+from django.db import transaction
+from django.db.models import Count, Prefetch
 from django.utils.functional import cached_property
 from django_filters.rest_framework import DjangoFilterBackend
 from edx_rbac.decorators import permission_required
@@ -110,7 +111,9 @@ class CustomerAgreementViewSet(PermissionRequiredForListingMixin, viewsets.ReadO
         if self.requested_customer_agreement_uuid:
             kwargs.update({'uuid': self.requested_customer_agreement_uuid})
 
-        return CustomerAgreement.objects.filter(**kwargs)
+        return CustomerAgreement.objects.filter(**kwargs).prefetch_related(
+            Prefetch('subscriptions', queryset=SubscriptionPlan.objects.for_serializer()),
+        )
 
 
 class LearnerSubscriptionViewSet(PermissionRequiredForListingMixin, viewsets.ReadOnlyModelViewSet):
@@ -166,7 +169,7 @@ class LearnerSubscriptionViewSet(PermissionRequiredForListingMixin, viewsets.Rea
         return SubscriptionPlan.objects.filter(
             customer_agreement__enterprise_customer_uuid=self.requested_enterprise_uuid,
             is_active=True
-        ).order_by('-start_date')
+        ).for_serializer().order_by('-start_date')
 
 
 class SubscriptionViewSet(LearnerSubscriptionViewSet):
@@ -187,7 +190,7 @@ class SubscriptionViewSet(LearnerSubscriptionViewSet):
                 customer_agreement__enterprise_customer_uuid=self.requested_enterprise_uuid,
                 is_active=True,
             )
-        return queryset.order_by('-start_date')
+        return queryset.for_serializer().order_by('-start_date')
 
 
 class LearnerLicenseViewSet(PermissionRequiredForListingMixin, viewsets.ReadOnlyModelViewSet):
@@ -251,7 +254,7 @@ class LearnerLicenseViewSet(PermissionRequiredForListingMixin, viewsets.ReadOnly
         return License.objects.filter(
             subscription_plan=self._get_subscription_plan(),
             user_email=self.request.user.email,
-        ).exclude(status=constants.REVOKED)
+        ).exclude(status=constants.REVOKED).for_serializer()
 
     def _get_subscription_plan(self):
         """
@@ -335,7 +338,7 @@ class LearnerLicensesViewSet(PermissionRequiredForListingMixin, ListModelMixin,
             user_email=user_email,
         ).exclude(
             status=constants.REVOKED
-        ).order_by('status', '-subscription_plan__expiration_date')
+        ).for_serializer().order_by('status', '-subscription_plan__expiration_date')
 
 
 class PageNumberPaginationWithCount(PageNumberPagination):
@@ -374,7 +377,9 @@ class LicenseViewSet(LearnerLicenseViewSet):
         For non-list actions, this is what's returned by `get_queryset()`.
         For list actions, some non-strict subset of this is what's returned by `get_queryset()`.
         """
-        return License.objects.filter(subscription_plan=self._get_subscription_plan()).order_by('status', 'user_email')
+        return License.objects.filter(
+            subscription_plan=self._get_subscription_plan(),
+        ).for_serializer().order_by('status', 'user_email')
 
     def _get_custom_text(self, data):
         """
@@ -1018,17 +1023,20 @@ class UserRetirementView(APIView):
 
         # Scrub all pii on licenses associated with the user
         associated_licenses = License.objects.filter(lms_user_id=lms_user_id)
-        for associated_license in associated_licenses:
-            # Scrub all pii on the revoked licenses, but they should stay revoked and keep their other info as we
-            # currently add an unassigned license to the subscription's license pool whenever one is revoked.
-            if associated_license.status == constants.REVOKED:
-                associated_license.clear_pii()
-            else:
-                # For all other types of licenses, we can just reset them to unassigned (which clears all fields)
-                associated_license.reset_to_unassigned()
-            associated_license.save()
-            # Clear historical pii after removing pii from the license itself
-            associated_license.clear_historical_pii()
+        # Scrub the licenses and their history together, so that a failure can't leave pii in the history of
+        # licenses that were already scrubbed
+        with transaction.atomic():
+            for associated_license in associated_licenses:
+                # Scrub all pii on the revoked licenses, but they should stay revoked and keep their other info as we
+                # currently add an unassigned license to the subscription's license pool whenever one is revoked.
+                if associated_license.status == constants.REVOKED:
+                    associated_license.clear_pii()
+                else:
+                    # For all other types of licenses, we can just reset them to unassigned (which clears all fields)
+                    associated_license.reset_to_unassigned()
+                associated_license.save()
+            # Clear historical pii after removing pii from the licenses themselves
+            License.bulk_clear_historical_pii(associated_licenses)
         associated_licenses_uuids = [license.uuid for license in associated_licenses]
         message = 'Retired {} licenses with uuids: {} for user with lms_user_id {}'.format(
             len(associated_licenses_uuids),
@@ -1102,7 +1110,7 @@ class StaffLicenseLookupView(LicenseBaseView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        user_licenses = License.by_user_email(user_email)
+        user_licenses = License.by_user_email(user_email).for_staff_serializer()
         if not user_licenses:
             return Response(
                 status=status.HTTP_404_NOT_FOUND,
@@ -18,6 +18,7 @@ from license_manager.apps.subscriptions.models import (
 class LicenseAdmin(admin.ModelAdmin):
     readonly_fields = ['activation_key']
     exclude = ['history']
+    list_select_related = ('subscription_plan',)
     list_display = (
         'uuid',
         'get_subscription_plan_title',
@@ -93,6 +94,7 @@ class SubscriptionPlanAdmin(admin.ModelAdmin):
         'is_active',
         'for_internal_use_only',
     )
+    list_select_related = ('customer_agreement',)
     search_fields = (
         'uuid__startswith',
         'title',
@@ -170,6 +172,9 @@ class CustomerAgreementAdmin(admin.ModelAdmin):
         'enterprise_customer_slug__startswith',
     )
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).prefetch_related('subscriptions')
+
     def get_readonly_fields(self, request, obj=None):
         """
         If the Customer Agreement already exists, make all fields but enterprise_customer_slug
@@ -216,6 +221,10 @@ class SubscriptionPlanRenewalAdmin(admin.ModelAdmin):
         'prior_subscription_plan__customer_agreement__enterprise_customer_uuid',
         'prior_subscription_plan__enterprise_catalog_uuid',
     )
+    list_select_related = (
+        'prior_subscription_plan__customer_agreement',
+        'renewed_subscription_plan',
+    )
     search_fields = (
         'prior_subscription_plan__title',
         'prior_subscription_plan__uuid__startswith',
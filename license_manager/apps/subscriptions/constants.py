@@ -60,3 +60,6 @@ VALIDATE_NUM_CATALOG_QUERIES_BATCH_SIZE = 100
 
 # Feature Toggles
 EXPOSE_LICENSE_ACTIVATION_KEY_OVER_API = 'expose_license_activation_key_over_api'
+
+# Number of seconds the enterprise catalog's answer to whether a catalog contains some content is cached for
+CONTAINS_CONTENT_CACHE_TIMEOUT = 60 * 5
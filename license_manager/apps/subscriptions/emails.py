@@ -119,28 +119,26 @@ def _send_email_with_activation(email_activation_key_map, context, enterprise_sl
         enterprise_slug (str): The slug associated with an enterprise to uniquely identify it.
         sender_alias (str): The alias to use in from email for sending the email.
     """
-    # Construct each message to be sent and appended onto the email list
-    email_recipient_list = email_activation_key_map.keys()
-    emails = []
-    for email_address in email_recipient_list:
-        # Construct user specific context for each message
-        context.update({
-            'LICENSE_ACTIVATION_LINK': get_license_activation_link(
-                enterprise_slug,
-                email_activation_key_map.get(email_address)
-            ),
-            'RECIPIENT_EMAIL': email_address,
-            'SOCIAL_MEDIA_FOOTER_URLS': settings.SOCIAL_MEDIA_FOOTER_URLS,
-            'MOBILE_STORE_URLS': settings.MOBILE_STORE_URLS,
-        })
-        emails.append(_message_from_context_and_template(context, sender_alias))
-
-    # Send out the emails in batches
-    email_chunks = chunks(emails, LICENSE_BULK_OPERATION_BATCH_SIZE)
-    for email_chunk in email_chunks:
+    # Construct and send the messages in batches, so that only one batch of rendered messages is held at a time
+    email_recipient_list = list(email_activation_key_map.keys())
+    for email_address_chunk in chunks(email_recipient_list, LICENSE_BULK_OPERATION_BATCH_SIZE):
+        emails = []
+        for email_address in email_address_chunk:
+            # Construct user specific context for each message
+            context.update({
+                'LICENSE_ACTIVATION_LINK': get_license_activation_link(
+                    enterprise_slug,
+                    email_activation_key_map.get(email_address)
+                ),
+                'RECIPIENT_EMAIL': email_address,
+                'SOCIAL_MEDIA_FOOTER_URLS': settings.SOCIAL_MEDIA_FOOTER_URLS,
+                'MOBILE_STORE_URLS': settings.MOBILE_STORE_URLS,
+            })
+            emails.append(_message_from_context_and_template(context, sender_alias))
+
         # Renew the email connection for each chunk of emails sent
         with mail.get_connection() as connection:
-            connection.send_messages(email_chunk)
+            connection.send_messages(emails)
 
 
 def _get_rendered_template_content(template_name, extension, context):
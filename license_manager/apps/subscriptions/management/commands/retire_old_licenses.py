@@ -2,6 +2,7 @@ import logging
 from datetime import datetime, timedelta
 
 from django.core.management.base import BaseCommand
+from django.db import transaction
 
 from license_manager.apps.subscriptions.constants import (
     ASSIGNED,
@@ -31,13 +32,15 @@ class Command(BaseCommand):
             subscription_plan__expiration_date__lt=ready_for_retirement_date,
         )
         # Scrub all piii on licenses whose subscription expired over 90 days ago, and mark the licenses as revoked
-        for expired_license in expired_licenses_for_retirement:
-            expired_license.clear_pii()
-            expired_license.status = REVOKED
-            expired_license.revoked_date = datetime.now()
-            expired_license.save()
-            # Clear historical pii after removing pii from the license itself
-            expired_license.clear_historical_pii()
+        with transaction.atomic():
+            for expired_license in expired_licenses_for_retirement:
+                expired_license.clear_pii()
+                expired_license.status = REVOKED
+                expired_license.revoked_date = datetime.now()
+                expired_license.save()
+            # Clear historical pii after removing pii from the licenses themselves, in the same transaction so that a
+            # failure can't leave pii in the history of licenses that were already scrubbed
+            License.bulk_clear_historical_pii(expired_licenses_for_retirement)
         expired_license_uuids = sorted([expired_license.uuid for expired_license in expired_licenses_for_retirement])
         message = 'Retired {} expired licenses with uuids: {}'.format(len(expired_license_uuids), expired_license_uuids)
         logger.info(message)
@@ -50,11 +53,13 @@ class Command(BaseCommand):
         )
         # Scrub all pii on the revoked licenses, but they should stay revoked and keep their other info as we currently
         # add an unassigned license to the subscription's license pool whenever one is revoked.
-        for revoked_license in revoked_licenses_for_retirement:
-            revoked_license.clear_pii()
-            revoked_license.save()
-            # Clear historical pii after removing pii from the license itself
-            revoked_license.clear_historical_pii()
+        with transaction.atomic():
+            for revoked_license in revoked_licenses_for_retirement:
+                revoked_license.clear_pii()
+                revoked_license.save()
+            # Clear historical pii after removing pii from the licenses themselves, in the same transaction so that a
+            # failure can't leave pii in the history of licenses that were already scrubbed
+            License.bulk_clear_historical_pii(revoked_licenses_for_retirement)
         revoked_license_uuids = sorted([revoked_license.uuid for revoked_license in revoked_licenses_for_retirement])
         message = 'Retired {} revoked licenses with uuids: {}'.format(len(revoked_license_uuids), revoked_license_uuids)
         logger.info(message)
@@ -66,11 +71,13 @@ class Command(BaseCommand):
         )
         # We place previously assigned licenses that are now retired back into the unassigned license pool, so we scrub
         # all data on them.
-        for assigned_license in assigned_licenses_for_retirement:
-            assigned_license.reset_to_unassigned()
-            assigned_license.save()
-            # Clear historical pii after removing pii from the license itself
-            assigned_license.clear_historical_pii()
+        with transaction.atomic():
+            for assigned_license in assigned_licenses_for_retirement:
+                assigned_license.reset_to_unassigned()
+                assigned_license.save()
+            # Clear historical pii after removing pii from the licenses themselves, in the same transaction so that a
+            # failure can't leave pii in the history of licenses that were already scrubbed
+            License.bulk_clear_historical_pii(assigned_licenses_for_retirement)
         assigned_license_uuids = sorted(
             [assigned_license.uuid for assigned_license in assigned_licenses_for_retirement],
         )
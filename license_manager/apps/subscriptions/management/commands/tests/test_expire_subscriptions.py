@@ -65,7 +65,9 @@ class ExpireSubscriptionsCommandTests(TestCase):
         expired_license_uuids = [str(license.uuid) for license in expired_subscription.licenses.filter(
             status__in=[ASSIGNED, ACTIVATED]
         )]
-        mock_license_expiration_task.assert_called_with(expired_license_uuids)
+        mock_license_expiration_task.assert_called_once()
+        actual_args = mock_license_expiration_task.call_args_list[0][0][0]
+        assert sorted(actual_args) == sorted(expired_license_uuids)
 
     @mock.patch(
         'license_manager.apps.subscriptions.management.commands.expire_subscriptions.license_expiration_task'
@@ -1,4 +1,5 @@
 from datetime import datetime, timedelta
+from unittest import mock
 
 from django.core.management import call_command
 from django.test import TestCase
@@ -11,6 +12,7 @@ from license_manager.apps.subscriptions.constants import (
     REVOKED,
     UNASSIGNED,
 )
+from license_manager.apps.subscriptions.models import License
 from license_manager.apps.subscriptions.tests.factories import (
     LicenseFactory,
     SubscriptionPlanFactory,
@@ -151,3 +153,20 @@ class RetireOldLicensesCommandTests(TestCase):
                 sorted([assigned_license.uuid for assigned_license in self.assigned_licenses_ready_for_retirement]),
             )
             assert message in log.output[2]
+
+    @mock.patch(
+        'license_manager.apps.subscriptions.models.License.bulk_clear_historical_pii',
+        side_effect=Exception('history unavailable'),
+    )
+    def test_retire_old_licenses_history_failure(self, _):
+        """
+        Verify that licenses are left untouched if their historical pii could not be cleared, so that pii is never
+        left in the history of scrubbed licenses.
+        """
+        with self.assertRaises(Exception):
+            call_command(self.command_name)
+
+        assert not License.objects.filter(
+            subscription_plan=self.expired_subscription_plan,
+            user_email__isnull=True,
+        ).exists()
@@ -0,0 +1,46 @@
+# Generated by Django 2.2.19 on 2026-10-15 02:05
+
+from django.db import migrations, models
+
+
+def populate_cached_max_expiration_date(apps, schema_editor):
+    """
+    Sets the latest expiration date, including future renewals, on every existing SubscriptionPlan.
+    """
+    SubscriptionPlan = apps.get_model('subscriptions', 'SubscriptionPlan')
+    SubscriptionPlanRenewal = apps.get_model('subscriptions', 'SubscriptionPlanRenewal')
+
+    renewals_by_prior_plan_uuid = {
+        renewal.prior_subscription_plan_id: renewal for renewal in SubscriptionPlanRenewal.objects.all()
+    }
+    subscription_plans = list(SubscriptionPlan.objects.all())
+    for plan in subscription_plans:
+        renewal_expiration_dates = []
+        renewal = renewals_by_prior_plan_uuid.get(plan.uuid)
+        while renewal:
+            renewal_expiration_dates.append(renewal.renewed_expiration_date)
+            renewal = renewals_by_prior_plan_uuid.get(renewal.renewed_subscription_plan_id)
+        plan.cached_max_expiration_date = max(renewal_expiration_dates, default=plan.expiration_date)
+
+    SubscriptionPlan.objects.bulk_update(subscription_plans, ['cached_max_expiration_date'], batch_size=100)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('subscriptions', '0021_subscriptionsroleassignment_applies_to_all_contexts'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='historicalsubscriptionplan',
+            name='cached_max_expiration_date',
+            field=models.DateField(blank=True, db_index=True, editable=False, help_text='The latest expiration date of the subscription, accounting for its future renewals. This is kept up to date whenever the subscription or one of its renewals is saved.', null=True),
+        ),
+        migrations.AddField(
+            model_name='subscriptionplan',
+            name='cached_max_expiration_date',
+            field=models.DateField(blank=True, db_index=True, editable=False, help_text='The latest expiration date of the subscription, accounting for its future renewals. This is kept up to date whenever the subscription or one of its renewals is saved.', null=True),
+        ),
+        migrations.RunPython(populate_cached_max_expiration_date, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 2.2.19 on 2026-10-15 02:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('subscriptions', '0022_add_cached_max_expiration_date'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='license',
+            index=models.Index(fields=['subscription_plan', 'status'], name='subscriptio_subscri_5fa0e2_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='license',
+            index=models.Index(fields=['user_email'], name='subscriptio_user_em_826a8e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='license',
+            index=models.Index(fields=['lms_user_id'], name='subscriptio_lms_use_6d7e3e_idx'),
+        ),
+    ]
@@ -1,11 +1,16 @@
-from math import ceil
-from operator import itemgetter
+from collections import defaultdict
+from datetime import date
+from functools import lru_cache
 from uuid import uuid4
 
 from django.core.validators import MinLengthValidator
-from django.db import models
+from django.db import models, transaction
+from django.db.models.functions import Coalesce, Floor
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.utils.functional import cached_property
 from django.utils.translation import gettext as _
+from edx_django_utils.cache import TieredCache, get_cache_key
 from edx_rbac.models import UserRole, UserRoleAssignment
 from edx_rbac.utils import ALL_ACCESS_CONTEXT
 from model_utils.models import TimeStampedModel
@@ -21,6 +26,7 @@ from license_manager.apps.api_client.enterprise_catalog import (
 from license_manager.apps.subscriptions.constants import (
     ACTIVATED,
     ASSIGNED,
+    CONTAINS_CONTENT_CACHE_TIMEOUT,
     LICENSE_BULK_OPERATION_BATCH_SIZE,
     LICENSE_STATUS_CHOICES,
     REVOKED,
@@ -28,12 +34,23 @@ from license_manager.apps.subscriptions.constants import (
     UNASSIGNED,
 )
 from license_manager.apps.subscriptions.utils import (
+    chunked,
+    chunks,
     days_until,
     get_license_activation_link,
     localized_utcnow,
 )
 
 
+@lru_cache(maxsize=None)
+def _get_enterprise_catalog_client():
+    """
+    Returns an enterprise catalog client shared across calls, so that its OAuth token and pooled connections are
+    reused rather than set up again for each request to the catalog service.
+    """
+    return EnterpriseCatalogApiClient()
+
+
 class CustomerAgreement(TimeStampedModel):
     """
     Stores information related to an agreement for a specific customer
@@ -75,24 +92,24 @@ class CustomerAgreement(TimeStampedModel):
 
     @property
     def ordered_subscription_plan_expirations(self):
-        subscription_plan_expiration_data = [
+        # Only a few scalar fields are needed, so skip building full model instances for each subscription. Active
+        # subscriptions come first, each ordered by the latest expiration including renewals.
+        subscriptions = self.subscriptions.order_by(
+            '-is_active',
+            Coalesce('cached_max_expiration_date', 'expiration_date').desc(),
+        ).values('uuid', 'is_active', 'expiration_date', 'cached_max_expiration_date')
+        return [
             {
-                'uuid': subscription.uuid,
-                'days_until_expiration': subscription.days_until_expiration,
-                'days_until_expiration_including_renewals': subscription.days_until_expiration_including_renewals,
-                'is_active': subscription.is_active,
+                'uuid': subscription['uuid'],
+                'days_until_expiration': days_until(subscription['expiration_date']),
+                'days_until_expiration_including_renewals': days_until(
+                    subscription['cached_max_expiration_date'] or subscription['expiration_date']
+                ),
+                'is_active': subscription['is_active'],
             }
-            for subscription in self.subscriptions.all()
+            for subscription in subscriptions
         ]
 
-        ordered_subscription_plan_data = sorted(
-            subscription_plan_expiration_data,
-            key=itemgetter('is_active', 'days_until_expiration_including_renewals'),
-            reverse=True,
-        )
-
-        return ordered_subscription_plan_data
-
     class Meta:
         verbose_name = _("Customer Agreement")
         verbose_name_plural = _("Customer Agreements")
@@ -108,6 +125,81 @@ class CustomerAgreement(TimeStampedModel):
         )
 
 
+class SubscriptionPlanQuerySet(models.QuerySet):
+    """
+    Custom queryset for SubscriptionPlans, providing annotations that save per-plan queries when listing plans.
+    """
+
+    def with_counts(self):
+        """
+        Annotates each plan with its license counts, which are then used by `num_licenses` and
+        `num_allocated_licenses` in place of a separate count query per plan.
+        """
+        return self.annotate(
+            _num_licenses=models.Count(
+                'licenses',
+                filter=~models.Q(licenses__status=REVOKED),
+            ),
+            _num_allocated_licenses=models.Count(
+                'licenses',
+                filter=models.Q(licenses__status__in=(ACTIVATED, ASSIGNED)),
+            ),
+        )
+
+    def with_revocation_stats(self):
+        """
+        Annotates each plan with its license counts, as `with_counts` does, along with the number of revocations
+        allowed against it, which `num_revocations_remaining` then uses in place of counting licenses per plan.
+        """
+        return self.with_counts().annotate(
+            _num_revocations_allowed=models.ExpressionWrapper(
+                Floor((models.F('_num_licenses') * models.F('revoke_max_percentage') + 99) / 100),
+                output_field=models.IntegerField(),
+            ),
+        )
+
+    def with_expiration_deltas(self):
+        """
+        Annotates each plan with the time remaining until it expires, with and without its future renewals, which
+        `days_until_expiration` and `days_until_expiration_including_renewals` then use in place of computing the
+        dates per plan.
+
+        Today's date is passed in from the app, rather than read from the database, so that the annotations agree with
+        `days_until` whatever time zone the database uses.
+        """
+        today = models.Value(date.today(), output_field=models.DateField())
+        return self.annotate(
+            _time_until_expiration=models.ExpressionWrapper(
+                models.F('expiration_date') - today,
+                output_field=models.DurationField(),
+            ),
+            _time_until_expiration_including_renewals=models.ExpressionWrapper(
+                Coalesce('cached_max_expiration_date', 'expiration_date') - today,
+                output_field=models.DurationField(),
+            ),
+        )
+
+    def for_serializer(self):
+        """
+        Joins the customer agreement and adds the annotations read by the `SubscriptionPlanSerializer`, so that
+        serializing a list of plans doesn't query per plan.
+        """
+        return self.select_related('customer_agreement').with_revocation_stats().with_expiration_deltas()
+
+    def with_license_cache(self):
+        """
+        Prefetches the status of each plan's licenses, which `num_licenses` and `num_allocated_licenses` then count in
+        memory. This suits callers that need to work with the licenses as well, otherwise prefer `with_counts`.
+        """
+        return self.prefetch_related(
+            models.Prefetch(
+                'licenses',
+                queryset=License.objects.only('status', 'subscription_plan'),
+                to_attr='_prefetched_licenses',
+            ),
+        )
+
+
 class SubscriptionPlan(TimeStampedModel):
     """
     Stores top-level information related to an enterprise Subscriptions purchase.
@@ -134,13 +226,30 @@ class SubscriptionPlan(TimeStampedModel):
         default=False
     )
 
+    cached_max_expiration_date = models.DateField(
+        blank=True,
+        null=True,
+        editable=False,
+        db_index=True,
+        help_text=_(
+            "The latest expiration date of the subscription, accounting for its future renewals. This is kept up to "
+            "date whenever the subscription or one of its renewals is saved."
+        )
+    )
+
     @property
     def days_until_expiration(self):
         """
         Returns the number of days remaining until a subscription expires.
 
         Note: expiration_date is a required field so checking for None isn't needed.
+
+        Uses the `_time_until_expiration` annotation from `SubscriptionPlan.objects.with_expiration_deltas()` when
+        present.
         """
+        time_until_expiration = getattr(self, '_time_until_expiration', None)
+        if time_until_expiration is not None:
+            return time_until_expiration.days
         return days_until(self.expiration_date)
 
     enterprise_catalog_uuid = models.UUIDField(
@@ -185,8 +294,14 @@ class SubscriptionPlan(TimeStampedModel):
         Gets the number of revocations that can still be made against this SubscriptionPlan.
 
         Note: This value is rounded up.
+
+        Uses the `_num_revocations_allowed` annotation from `SubscriptionPlan.objects.with_revocation_stats()` when
+        present.
         """
-        num_revocations_allowed = ceil(self.num_licenses * (self.revoke_max_percentage / 100))
+        num_revocations_allowed = getattr(self, '_num_revocations_allowed', None)
+        if num_revocations_allowed is None:
+            # Integer arithmetic rounds the allowed number of revocations up without going through a float
+            num_revocations_allowed = (self.num_licenses * self.revoke_max_percentage + 99) // 100
         return num_revocations_allowed - self.num_revocations_applied
     num_revocations_remaining.fget.short_description = "Number of Revocations Remaining"
 
@@ -213,7 +328,7 @@ class SubscriptionPlan(TimeStampedModel):
         )
     )
 
-    @property
+    @cached_property
     def enterprise_customer_uuid(self):
         """
         A link to the customer on the subscription's customer agreement.
@@ -243,10 +358,22 @@ class SubscriptionPlan(TimeStampedModel):
         licenses remains the same when one is revoked (and the revoked one no longer factors into the
         allocated) count.
 
+        Uses the `_num_licenses` annotation from `SubscriptionPlan.objects.with_counts()` when present, or the
+        licenses prefetched by `SubscriptionPlan.objects.with_license_cache()`.
+
         Returns:
             int
         """
-        return self.licenses.exclude(status=REVOKED).count()
+        num_licenses = getattr(self, '_num_licenses', None)
+        if num_licenses is not None:
+            return num_licenses
+        if hasattr(self, '_prefetched_licenses'):
+            return sum(
+                1 for subscription_license in self._prefetched_licenses  # pylint: disable=no-member
+                if subscription_license.status != REVOKED
+            )
+        # Query the licenses directly, as the `licenses` manager reuses any prefetch of them, which may be filtered
+        return License.objects.filter(subscription_plan=self).exclude(status=REVOKED).count()
 
     @property
     def num_allocated_licenses(self):
@@ -256,11 +383,22 @@ class SubscriptionPlan(TimeStampedModel):
         of allocated as we in practice allow allocating more licenses to make up for the revoked one. This is done
         by the creation of a new, unassigned license whenever a license is revoked.
 
+        Uses the `_num_allocated_licenses` annotation from `SubscriptionPlan.objects.with_counts()` when present, or
+        the licenses prefetched by `SubscriptionPlan.objects.with_license_cache()`.
+
         Returns:
         int: The count of how many licenses that are associated with the subscription plan are
             already allocated.
         """
-        return self.licenses.filter(status__in=(ACTIVATED, ASSIGNED)).count()
+        num_allocated_licenses = getattr(self, '_num_allocated_licenses', None)
+        if num_allocated_licenses is not None:
+            return num_allocated_licenses
+        if hasattr(self, '_prefetched_licenses'):
+            return sum(
+                1 for subscription_license in self._prefetched_licenses  # pylint: disable=no-member
+                if subscription_license.status in (ACTIVATED, ASSIGNED)
+            )
+        return License.objects.filter(subscription_plan=self, status__in=(ACTIVATED, ASSIGNED)).count()
 
     @property
     def future_renewals(self):
@@ -269,17 +407,31 @@ class SubscriptionPlan(TimeStampedModel):
 
         The collected renewals are "future" renewals in that it does not return the renewal that might have created
         this subscription or any renewals before that.
+
+        Renewed subscriptions are expected to belong to the same customer agreement, so the renewals for the whole
+        agreement are fetched in a single query and the chain is walked in memory. A renewal into a subscription under
+        a different agreement is still followed, at the cost of a query for that step.
         """
+        renewals_by_prior_plan_uuid = {
+            renewal.prior_subscription_plan_id: renewal
+            for renewal in SubscriptionPlanRenewal.objects.filter(
+                prior_subscription_plan__customer_agreement_id=self.customer_agreement_id,
+            ).select_related('renewed_subscription_plan')
+        }
+
         renewals = []
-        current_renewal = self.get_renewal()
+        current_renewal = renewals_by_prior_plan_uuid.get(self.uuid)
 
         # Traverse forwards through the renewals that are associated with this plan
         while current_renewal:
             renewals.append(current_renewal)
-            try:
-                current_renewal = current_renewal.renewed_subscription_plan.get_renewal()
-            except AttributeError:
-                current_renewal = None
+            renewed_plan = current_renewal.renewed_subscription_plan
+            if not renewed_plan:
+                break
+            if renewed_plan.customer_agreement_id == self.customer_agreement_id:
+                current_renewal = renewals_by_prior_plan_uuid.get(renewed_plan.uuid)
+            else:
+                current_renewal = renewed_plan.get_renewal()
 
         return renewals
 
@@ -287,13 +439,35 @@ class SubscriptionPlan(TimeStampedModel):
     def days_until_expiration_including_renewals(self):
         """
         Returns the number of days remaining until a subscription expires, accounting for its future renewals.
+
+        Uses the `_time_until_expiration_including_renewals` annotation from
+        `SubscriptionPlan.objects.with_expiration_deltas()` when present.
+        """
+        time_until_expiration = getattr(self, '_time_until_expiration_including_renewals', None)
+        if time_until_expiration is not None:
+            return time_until_expiration.days
+        if self.cached_max_expiration_date:
+            return days_until(self.cached_max_expiration_date)
+        return days_until(self.get_max_expiration_date_including_renewals())
+
+    def get_max_expiration_date_including_renewals(self):
+        """
+        Returns the latest expiration date of the subscription, accounting for its future renewals.
+
+        This walks the chain of future renewals, so prefer reading `cached_max_expiration_date` where possible.
+        """
+        return self.get_max_renewal_expiration_date() or self.expiration_date
+
+    def get_max_renewal_expiration_date(self):
+        """
+        Returns the latest expiration date of the subscription's future renewals, or None if it has none.
         """
+        if self._state.adding:
+            # An unsaved subscription can't have any renewals yet
+            return None
+
         renewal_expiration_dates = [renewal.renewed_expiration_date for renewal in self.future_renewals]
-        try:
-            return days_until(max(renewal_expiration_dates))
-        except ValueError:
-            # A value error indicates that there were no renewals
-            return self.days_until_expiration
+        return max(renewal_expiration_dates, default=None)
 
     def get_renewal(self):
         """
@@ -304,12 +478,25 @@ class SubscriptionPlan(TimeStampedModel):
         except SubscriptionPlanRenewal.DoesNotExist:
             return None
 
+    def get_origin_renewal(self):
+        """
+        Helper to safely return the renewal that created the subscription, or None if one does not exist.
+        """
+        try:
+            return self.origin_renewal  # pylint: disable=no-member
+        except SubscriptionPlanRenewal.DoesNotExist:
+            return None
+
     def increase_num_licenses(self, num_new_licenses):
         """
         Method to increase the number of licenses associated with an instance of SubscriptionPlan by num_new_licenses.
+
+        Licenses are built and created a batch at a time, so that large increases don't hold every new license (and
+        its historical record) in memory at once.
         """
-        new_licenses = [License(subscription_plan=self) for _ in range(num_new_licenses)]
-        License.bulk_create(new_licenses)
+        with transaction.atomic():
+            for license_batch in chunks(range(num_new_licenses), LICENSE_BULK_OPERATION_BATCH_SIZE):
+                License.bulk_create([License(subscription_plan=self) for _ in license_batch])
 
     def contains_content(self, content_ids):
         """
@@ -324,15 +511,61 @@ class SubscriptionPlan(TimeStampedModel):
         Returns:
             bool: Whether the given content_ids are part of the subscription.
         """
-        enterprise_catalog_client = EnterpriseCatalogApiClient()
+        # The order of the content ids doesn't change the answer, so sort them to share cache entries between callers
+        cache_key = get_cache_key(
+            resource='contains_content_items',
+            enterprise_catalog_uuid=self.enterprise_catalog_uuid,
+            content_ids=sorted(content_ids),
+        )
+        cached_response = TieredCache.get_cached_response(cache_key)
+        if cached_response.is_found:
+            return cached_response.value
+
+        enterprise_catalog_client = _get_enterprise_catalog_client()
         content_in_catalog = enterprise_catalog_client.contains_content_items(
             self.enterprise_catalog_uuid,
             content_ids,
         )
+        TieredCache.set_all_tiers(cache_key, content_in_catalog, CONTAINS_CONTENT_CACHE_TIMEOUT)
         return content_in_catalog
 
     history = HistoricalRecords()
 
+    objects = SubscriptionPlanQuerySet.as_manager()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the loaded expiration date, so that saving can tell whether it has changed
+        instance._loaded_expiration_date = instance.__dict__.get('expiration_date')  # pylint: disable=protected-access
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None):
+        super().refresh_from_db(using=using, fields=fields)
+        if fields is None or 'expiration_date' in fields:
+            # pylint: disable=attribute-defined-outside-init
+            self._loaded_expiration_date = self.expiration_date
+
+    def save(self, *args, **kwargs):
+        """
+        Keeps `cached_max_expiration_date` in sync with the subscription's expiration date and renewals.
+
+        Changes to renewals update the cached date themselves, so it is only recomputed here when the subscription is
+        new or its expiration date is being saved with a different value.
+        """
+        update_fields = kwargs.get('update_fields')
+        expiration_date_changed = (
+            self._state.adding or self.expiration_date != getattr(self, '_loaded_expiration_date', None)
+        )
+        if expiration_date_changed and (update_fields is None or 'expiration_date' in update_fields):
+            self.cached_max_expiration_date = self.get_max_expiration_date_including_renewals()
+            if update_fields is not None:
+                kwargs['update_fields'] = set(update_fields) | {'cached_max_expiration_date'}
+        super().save(*args, **kwargs)
+        if update_fields is None or 'expiration_date' in update_fields:
+            # pylint: disable=attribute-defined-outside-init
+            self._loaded_expiration_date = self.expiration_date
+
     class Meta:
         verbose_name = _("Subscription Plan")
         verbose_name_plural = _("Subscription Plans")
@@ -419,6 +652,43 @@ class SubscriptionPlanRenewal(TimeStampedModel):
         verbose_name = _("Subscription Plan Renewal")
         verbose_name_plural = _("Subscription Plan Renewals")
 
+    def update_cached_max_expiration_dates(self):
+        """
+        Updates the `cached_max_expiration_date` of the prior subscription and of every subscription that was renewed
+        into it, as all of them have this renewal in their chain of future renewals.
+
+        This is called by a receiver whenever a renewal is saved or deleted.
+        """
+        # Fetch the prior subscription again, as a cached `renewal` on the related instance may be out of date
+        subscription_plan = SubscriptionPlan.objects.filter(uuid=self.prior_subscription_plan_id).first()
+        if not subscription_plan:
+            # The prior subscription is being deleted along with this renewal
+            return
+
+        max_renewal_expiration_date = subscription_plan.get_max_renewal_expiration_date()
+        max_expiration_date = max_renewal_expiration_date or subscription_plan.expiration_date
+        if self._meta.get_field('prior_subscription_plan').is_cached(self):
+            self.prior_subscription_plan.cached_max_expiration_date = max_expiration_date
+
+        # Walk backwards through the renewals that led to the prior subscription, grouping subscriptions by their
+        # expiration date so that each distinct date (typically only one) takes a single update. Every earlier
+        # subscription has at least its renewal into the next one, so, as in
+        # `get_max_expiration_date_including_renewals`, its date is the latest of its renewals' expiration dates.
+        plan_uuids_by_expiration_date = defaultdict(list)
+        while subscription_plan:
+            plan_uuids_by_expiration_date[max_expiration_date].append(subscription_plan.uuid)
+            origin_renewal = subscription_plan.get_origin_renewal()
+            if not origin_renewal:
+                break
+            max_renewal_expiration_date = max(
+                filter(None, (max_renewal_expiration_date, origin_renewal.renewed_expiration_date)),
+            )
+            max_expiration_date = max_renewal_expiration_date
+            subscription_plan = origin_renewal.prior_subscription_plan
+
+        for expiration_date, plan_uuids in plan_uuids_by_expiration_date.items():
+            SubscriptionPlan.objects.filter(uuid__in=plan_uuids).update(cached_max_expiration_date=expiration_date)
+
     def __str__(self):
         """
         Return human-readable string representation.
@@ -435,6 +705,58 @@ class SubscriptionPlanRenewal(TimeStampedModel):
         )
 
 
+@receiver(post_save, sender=SubscriptionPlanRenewal)
+@receiver(post_delete, sender=SubscriptionPlanRenewal)
+def update_renewed_subscriptions(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Keeps the cached expiration dates of the subscriptions renewed by a renewal up to date. Unlike overriding the
+    model's `save` and `delete`, the signals are also sent for queryset deletes and deletes cascaded from a
+    subscription.
+    """
+    if kwargs.get('raw'):
+        # Skip loading fixtures, where the related subscriptions may not have been loaded yet
+        return
+    instance.update_cached_max_expiration_dates()
+
+
+class LicenseQuerySet(models.QuerySet):
+    """
+    Custom queryset for Licenses.
+    """
+
+    def for_serializer(self):
+        """
+        Limits the selected columns to the ones read by the `LicenseSerializer`.
+        """
+        return self.only(
+            'uuid',
+            'status',
+            'user_email',
+            'activation_date',
+            'last_remind_date',
+            'activation_key',
+        )
+
+    def for_staff_serializer(self):
+        """
+        Joins the subscription plan and customer agreement read by the `StaffLicenseSerializer`, and limits the
+        selected columns to the ones it reads.
+        """
+        return self.select_related(
+            'subscription_plan__customer_agreement',
+        ).only(
+            'status',
+            'assigned_date',
+            'activation_date',
+            'revoked_date',
+            'last_remind_date',
+            'activation_key',
+            'subscription_plan__title',
+            'subscription_plan__expiration_date',
+            'subscription_plan__customer_agreement__enterprise_customer_slug',
+        )
+
+
 class License(TimeStampedModel):
     """
     Stores information related to an individual subscriptions license.
@@ -516,11 +838,18 @@ class License(TimeStampedModel):
 
     history = HistoricalRecords()
 
+    objects = LicenseQuerySet.as_manager()
+
     class Meta:
         unique_together = (
             ('subscription_plan', 'user_email'),
             ('subscription_plan', 'lms_user_id'),
         )
+        indexes = [
+            models.Index(fields=['subscription_plan', 'status']),
+            models.Index(fields=['user_email']),
+            models.Index(fields=['lms_user_id']),
+        ]
 
     def __str__(self):
         """
@@ -555,11 +884,17 @@ class License(TimeStampedModel):
         self.user_email = None
         self.lms_user_id = None
 
-    def clear_historical_pii(self):
+    @classmethod
+    def bulk_clear_historical_pii(cls, licenses):
         """
-        Helper function to remove pii (user_email & lms_user_id) from the license's historical records.
+        Removes pii (user_email & lms_user_id) from the historical records of all the given licenses, with an update
+        per batch of licenses rather than per license.
         """
-        self.history.update(user_email=None, lms_user_id=None)  # pylint: disable=no-member
+        license_uuids = [user_license.uuid for user_license in licenses]
+        for license_uuid_batch in chunks(license_uuids, LICENSE_BULK_OPERATION_BATCH_SIZE):
+            cls.history.filter(  # pylint: disable=no-member
+                uuid__in=license_uuid_batch,
+            ).update(user_email=None, lms_user_id=None)
 
     def reset_to_unassigned(self):
         """
@@ -590,14 +925,35 @@ class License(TimeStampedModel):
         """
         Helper function to bulk set the field given by `date_field_name` on a group of licenses to now.
 
+        Every license gets the same value, so rather than a per-row bulk_update this issues a single UPDATE for each
+        batch of licenses, and then bulk creates the matching historical records.
+
+        Licenses should be passed as a queryset where possible, so that they are read from the database in batches
+        rather than all being held in memory at once.
+
         Args:
-            licenses (iterable): The licenses to set the field to now on.
+            licenses (QuerySet or iterable): The licenses to set the field to now on.
             date_field_name (list of str): The names of the date field to set to now.
         """
-        for subscription_license in licenses:
-            for field_name in date_field_names:
-                setattr(subscription_license, field_name, localized_utcnow())
-        License.bulk_update(licenses, date_field_names)
+        now = localized_utcnow()
+        updated_fields = {field_name: now for field_name in date_field_names}
+        if isinstance(licenses, models.QuerySet):
+            licenses = licenses.iterator(chunk_size=LICENSE_BULK_OPERATION_BATCH_SIZE)
+
+        with transaction.atomic(savepoint=False):
+            for license_batch in chunked(licenses, LICENSE_BULK_OPERATION_BATCH_SIZE):
+                for subscription_license in license_batch:
+                    for field_name, value in updated_fields.items():
+                        setattr(subscription_license, field_name, value)
+
+                License.objects.filter(
+                    uuid__in=[subscription_license.uuid for subscription_license in license_batch],
+                ).update(**updated_fields)
+                License.history.bulk_history_create(  # pylint: disable=no-member
+                    license_batch,
+                    batch_size=LICENSE_BULK_OPERATION_BATCH_SIZE,
+                    update=True,
+                )
 
     @classmethod
     def bulk_create(cls, license_objects, batch_size=LICENSE_BULK_OPERATION_BATCH_SIZE):
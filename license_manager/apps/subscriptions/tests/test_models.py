@@ -1,13 +1,32 @@
+from datetime import date, timedelta
 from unittest import mock
 
 import ddt
+from django.db import models
 from django.test import TestCase
+from edx_django_utils.cache import TieredCache
+from freezegun import freeze_time
 
-from license_manager.apps.subscriptions.constants import REVOKED, UNASSIGNED
-from license_manager.apps.subscriptions.models import License, SubscriptionPlan
+from license_manager.apps.subscriptions.constants import (
+    ACTIVATED,
+    ASSIGNED,
+    LICENSE_BULK_OPERATION_BATCH_SIZE,
+    REVOKED,
+    UNASSIGNED,
+)
+from license_manager.apps.subscriptions.models import (
+    License,
+    SubscriptionPlan,
+    SubscriptionPlanRenewal,
+    _get_enterprise_catalog_client,
+)
 from license_manager.apps.subscriptions.tests.factories import (
+    CustomerAgreementFactory,
+    LicenseFactory,
     SubscriptionPlanFactory,
+    SubscriptionPlanRenewalFactory,
 )
+from license_manager.apps.subscriptions.utils import days_until
 
 
 @ddt.ddt
@@ -22,6 +41,15 @@ class SubscriptionsModelTests(TestCase):
 
         cls.subscription_plan = SubscriptionPlanFactory()
 
+    def setUp(self):
+        super().setUp()
+        # Drop cached catalog results and the shared catalog client before and after each test, so that each test
+        # creates its own, mocked, client and no mocked client outlives the test that created it
+        TieredCache.dangerous_clear_all_tiers()
+        _get_enterprise_catalog_client.cache_clear()
+        self.addCleanup(TieredCache.dangerous_clear_all_tiers)
+        self.addCleanup(_get_enterprise_catalog_client.cache_clear)
+
     @mock.patch('license_manager.apps.subscriptions.models.EnterpriseCatalogApiClient', return_value=mock.MagicMock())
     @ddt.data(True, False)
     def test_contains_content(self, contains_content, mock_enterprise_catalog_client):
@@ -34,6 +62,327 @@ class SubscriptionsModelTests(TestCase):
             content_ids,
         )
 
+    @mock.patch('license_manager.apps.subscriptions.models.EnterpriseCatalogApiClient', return_value=mock.MagicMock())
+    def test_contains_content_cached(self, mock_enterprise_catalog_client):
+        """
+        Verify the catalog's answer is cached, regardless of the order of the content ids.
+        """
+        mock_enterprise_catalog_client().contains_content_items.return_value = False
+        assert self.subscription_plan.contains_content(['test-key', 'another-key']) is False
+        assert self.subscription_plan.contains_content(['another-key', 'test-key']) is False
+        mock_enterprise_catalog_client().contains_content_items.assert_called_once()
+
+        # A different set of content is checked against the catalog again
+        mock_enterprise_catalog_client().contains_content_items.return_value = True
+        assert self.subscription_plan.contains_content(['test-key']) is True
+        assert mock_enterprise_catalog_client().contains_content_items.call_count == 2
+
+    @mock.patch('license_manager.apps.subscriptions.models.EnterpriseCatalogApiClient')
+    def test_contains_content_reuses_client(self, mock_enterprise_catalog_client):
+        """
+        Verify a single enterprise catalog client is created and shared between checks.
+        """
+        mock_enterprise_catalog_client.return_value.contains_content_items.return_value = True
+        self.subscription_plan.contains_content(['test-key'])
+        self.subscription_plan.contains_content(['another-key'])
+        mock_enterprise_catalog_client.assert_called_once_with()
+        assert mock_enterprise_catalog_client.return_value.contains_content_items.call_count == 2
+
+    def test_with_counts(self):
+        """
+        Verify the annotated and prefetched license counts match the per-plan count queries, and are used without
+        querying again.
+        """
+        subscription_plan = SubscriptionPlanFactory()
+        for status, num_licenses in ((ACTIVATED, 3), (ASSIGNED, 2), (UNASSIGNED, 4), (REVOKED, 1)):
+            LicenseFactory.create_batch(num_licenses, subscription_plan=subscription_plan, status=status)
+
+        assert subscription_plan.num_licenses == 9
+        assert subscription_plan.num_allocated_licenses == 5
+
+        annotated_plan = SubscriptionPlan.objects.with_counts().get(uuid=subscription_plan.uuid)
+        with self.assertNumQueries(0):
+            assert annotated_plan.num_licenses == 9
+            assert annotated_plan.num_allocated_licenses == 5
+
+        with self.assertNumQueries(2):
+            prefetched_plan = SubscriptionPlan.objects.with_license_cache().get(uuid=subscription_plan.uuid)
+            assert prefetched_plan.num_licenses == 9
+            assert prefetched_plan.num_allocated_licenses == 5
+
+        # Other prefetches of the licenses, which may be filtered, are not used for the counts
+        filtered_plan = SubscriptionPlan.objects.prefetch_related(
+            models.Prefetch('licenses', queryset=License.objects.filter(status=ACTIVATED)),
+        ).get(uuid=subscription_plan.uuid)
+        assert filtered_plan.num_licenses == 9
+        assert filtered_plan.num_allocated_licenses == 5
+
+    @ddt.data(
+        (0, 5, 0),
+        (9, 5, 1),
+        (20, 5, 1),
+        (21, 5, 2),
+        (10, 0, 0),
+        (10, 100, 10),
+    )
+    @ddt.unpack
+    def test_with_revocation_stats(self, num_licenses, revoke_max_percentage, expected_revocations_allowed):
+        """
+        Verify the annotated number of revocations remaining is rounded up, and matches the unannotated value.
+        """
+        subscription_plan = SubscriptionPlanFactory(
+            revoke_max_percentage=revoke_max_percentage,
+            num_revocations_applied=0,
+        )
+        LicenseFactory.create_batch(num_licenses, subscription_plan=subscription_plan)
+        assert subscription_plan.num_revocations_remaining == expected_revocations_allowed
+
+        annotated_plan = SubscriptionPlan.objects.with_revocation_stats().get(uuid=subscription_plan.uuid)
+        annotated_plan.num_revocations_applied = 1
+        with self.assertNumQueries(0):
+            assert annotated_plan.num_revocations_remaining == expected_revocations_allowed - 1
+
+    def test_increase_num_licenses(self):
+        """
+        Verify that licenses are created across multiple batches, each with a creation history record.
+        """
+        subscription_plan = SubscriptionPlanFactory()
+        num_new_licenses = LICENSE_BULK_OPERATION_BATCH_SIZE * 2 + 1
+
+        subscription_plan.increase_num_licenses(num_new_licenses)
+
+        assert subscription_plan.unassigned_licenses.count() == num_new_licenses
+        assert License.history.filter(  # pylint: disable=no-member
+            subscription_plan=subscription_plan,
+            history_type='+',
+        ).count() == num_new_licenses
+
+    def test_future_renewals(self):
+        """
+        Verify that a chain of renewals is collected in order with a single query.
+        """
+        customer_agreement = CustomerAgreementFactory()
+        plans = SubscriptionPlanFactory.create_batch(3, customer_agreement=customer_agreement)
+        renewals = [
+            SubscriptionPlanRenewalFactory(prior_subscription_plan=prior_plan, renewed_subscription_plan=renewed_plan)
+            for prior_plan, renewed_plan in zip(plans, plans[1:])
+        ]
+        renewals.append(SubscriptionPlanRenewalFactory(prior_subscription_plan=plans[-1]))
+
+        first_plan = SubscriptionPlan.objects.get(uuid=plans[0].uuid)
+        with self.assertNumQueries(1):
+            assert first_plan.future_renewals == renewals
+        assert SubscriptionPlan.objects.get(uuid=plans[1].uuid).future_renewals == renewals[1:]
+
+    def test_cached_max_expiration_date(self):
+        """
+        Verify that saving or deleting renewals keeps the cached expiration of every plan in the chain up to date.
+        """
+        prior_plan = SubscriptionPlanFactory(expiration_date=date.today() + timedelta(days=10))
+        assert prior_plan.cached_max_expiration_date == prior_plan.expiration_date
+
+        renewed_plan = SubscriptionPlanFactory(expiration_date=date.today() + timedelta(days=100))
+        SubscriptionPlanRenewalFactory(
+            prior_subscription_plan=prior_plan,
+            renewed_subscription_plan=renewed_plan,
+            renewed_expiration_date=renewed_plan.expiration_date,
+        )
+        last_renewal = SubscriptionPlanRenewalFactory(
+            prior_subscription_plan=renewed_plan,
+            renewed_expiration_date=date.today() + timedelta(days=200),
+        )
+        for plan in (prior_plan, renewed_plan):
+            plan.refresh_from_db()
+            assert plan.cached_max_expiration_date == last_renewal.renewed_expiration_date
+            assert plan.days_until_expiration_including_renewals == 200
+
+        last_renewal.delete()
+        for plan in (prior_plan, renewed_plan):
+            plan.refresh_from_db()
+            assert plan.cached_max_expiration_date == renewed_plan.expiration_date
+
+    def test_cached_max_expiration_date_queryset_delete(self):
+        """
+        Verify that deleting renewals through a queryset, or along with the subscription they renew into, keeps the
+        cached expiration of the prior plan up to date.
+        """
+        prior_plan = SubscriptionPlanFactory(expiration_date=date.today() + timedelta(days=10))
+        SubscriptionPlanRenewalFactory(
+            prior_subscription_plan=prior_plan,
+            renewed_expiration_date=date.today() + timedelta(days=300),
+        )
+        prior_plan.refresh_from_db()
+        assert prior_plan.days_until_expiration_including_renewals == 300
+
+        SubscriptionPlanRenewal.objects.filter(prior_subscription_plan=prior_plan).delete()
+        prior_plan.refresh_from_db()
+        assert prior_plan.future_renewals == []
+        assert prior_plan.cached_max_expiration_date == prior_plan.expiration_date
+        assert prior_plan.days_until_expiration_including_renewals == 10
+
+        renewed_plan = SubscriptionPlanFactory()
+        SubscriptionPlanRenewalFactory(
+            prior_subscription_plan=prior_plan,
+            renewed_subscription_plan=renewed_plan,
+            renewed_expiration_date=date.today() + timedelta(days=300),
+        )
+        renewed_plan.delete()
+        prior_plan.refresh_from_db()
+        assert prior_plan.cached_max_expiration_date == prior_plan.expiration_date
+
+    def test_save_skips_unchanged_expiration_date(self):
+        """
+        Verify that saving a plan only recomputes its cached expiration when its expiration date changes.
+        """
+        subscription_plan = SubscriptionPlan.objects.get(uuid=self.subscription_plan.uuid)
+        SubscriptionPlanRenewalFactory(
+            prior_subscription_plan=subscription_plan,
+            renewed_expiration_date=subscription_plan.expiration_date + timedelta(days=365),
+        )
+        subscription_plan = SubscriptionPlan.objects.get(uuid=self.subscription_plan.uuid)
+
+        # Only the update of the plan, and its historical record
+        subscription_plan.num_revocations_applied += 1
+        with self.assertNumQueries(2):
+            subscription_plan.save()
+
+        # Saving a new expiration date recomputes the cached one, even when only some fields are saved
+        unrenewed_plan = SubscriptionPlan.objects.get(uuid=SubscriptionPlanFactory().uuid)
+        unrenewed_plan.expiration_date += timedelta(days=30)
+        unrenewed_plan.save(update_fields=['expiration_date'])
+        unrenewed_plan.refresh_from_db()
+        assert unrenewed_plan.cached_max_expiration_date == unrenewed_plan.expiration_date
+
+    def test_save_recomputes_after_unrelated_save(self):
+        """
+        Verify that a changed expiration date saved after a save of other fields still recomputes the cached date.
+        """
+        subscription_plan = SubscriptionPlan.objects.get(uuid=SubscriptionPlanFactory().uuid)
+        subscription_plan.expiration_date = date.today() + timedelta(days=50)
+        subscription_plan.save(update_fields=['title'])
+        subscription_plan.save()
+
+        subscription_plan.refresh_from_db()
+        assert subscription_plan.cached_max_expiration_date == date.today() + timedelta(days=50)
+
+    def test_save_recomputes_after_refresh_from_db(self):
+        """
+        Verify that saving after `refresh_from_db` compares against the refreshed expiration date.
+        """
+        original_expiration_date = date.today() + timedelta(days=10)
+        subscription_plan = SubscriptionPlan.objects.get(
+            uuid=SubscriptionPlanFactory(expiration_date=original_expiration_date).uuid,
+        )
+        other_instance = SubscriptionPlan.objects.get(uuid=subscription_plan.uuid)
+        other_instance.expiration_date = date.today() + timedelta(days=50)
+        other_instance.save()
+
+        subscription_plan.refresh_from_db()
+        subscription_plan.expiration_date = original_expiration_date
+        subscription_plan.save()
+
+        subscription_plan.refresh_from_db()
+        assert subscription_plan.cached_max_expiration_date == original_expiration_date
+
+    def test_cached_max_expiration_date_matches_renewal_chain(self):
+        """
+        Verify the cached expiration of earlier plans in a chain matches recomputing it from their renewals.
+        """
+        prior_plan = SubscriptionPlanFactory(expiration_date=date.today() + timedelta(days=10))
+        renewed_plan = SubscriptionPlanFactory(expiration_date=date.today() + timedelta(days=150))
+        SubscriptionPlanRenewalFactory(
+            prior_subscription_plan=prior_plan,
+            renewed_subscription_plan=renewed_plan,
+            renewed_expiration_date=date.today() + timedelta(days=100),
+        )
+        SubscriptionPlanRenewalFactory(
+            prior_subscription_plan=renewed_plan,
+            renewed_expiration_date=date.today() + timedelta(days=200),
+        ).delete()
+
+        for plan in (prior_plan, renewed_plan):
+            plan.refresh_from_db()
+            assert plan.cached_max_expiration_date == plan.get_max_expiration_date_including_renewals()
+        assert prior_plan.cached_max_expiration_date == date.today() + timedelta(days=100)
+
+    def test_with_expiration_deltas(self):
+        """
+        Verify the annotated days until expiration match the unannotated values, and are used without querying again.
+        """
+        subscription_plan = SubscriptionPlanFactory(expiration_date=date.today() + timedelta(days=30))
+        SubscriptionPlanRenewalFactory(
+            prior_subscription_plan=subscription_plan,
+            renewed_expiration_date=date.today() + timedelta(days=400),
+        )
+
+        plan = SubscriptionPlan.objects.get(uuid=subscription_plan.uuid)
+        assert plan.days_until_expiration == days_until(plan.expiration_date) == 30
+        assert plan.days_until_expiration_including_renewals == days_until(plan.cached_max_expiration_date) == 400
+
+        annotated_plan = SubscriptionPlan.objects.with_expiration_deltas().get(uuid=subscription_plan.uuid)
+        with self.assertNumQueries(0):
+            assert annotated_plan.days_until_expiration == plan.days_until_expiration
+            assert annotated_plan.days_until_expiration_including_renewals == (
+                plan.days_until_expiration_including_renewals
+            )
+
+    def test_with_expiration_deltas_uses_app_date(self):
+        """
+        Verify the annotations count days from the app's date, as `days_until` does, rather than from the database's.
+        """
+        subscription_plan = SubscriptionPlanFactory(expiration_date=date(2030, 1, 31))
+
+        with freeze_time('2030-01-01'):
+            annotated_plan = SubscriptionPlan.objects.with_expiration_deltas().get(uuid=subscription_plan.uuid)
+            assert annotated_plan.days_until_expiration == days_until(subscription_plan.expiration_date) == 30
+
+
+class CustomerAgreementModelTests(TestCase):
+    """
+    Tests for the CustomerAgreement model.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.customer_agreement = CustomerAgreementFactory()
+        cls.inactive_plan = SubscriptionPlanFactory(
+            customer_agreement=cls.customer_agreement,
+            is_active=False,
+            expiration_date=date.today() + timedelta(days=500),
+        )
+        cls.short_plan = SubscriptionPlanFactory(
+            customer_agreement=cls.customer_agreement,
+            expiration_date=date.today() + timedelta(days=10),
+        )
+        cls.renewed_plan = SubscriptionPlanFactory(
+            customer_agreement=cls.customer_agreement,
+            expiration_date=date.today() + timedelta(days=20),
+        )
+        cls.renewal = SubscriptionPlanRenewalFactory(
+            prior_subscription_plan=cls.renewed_plan,
+            effective_date=date.today() + timedelta(days=21),
+            renewed_expiration_date=date.today() + timedelta(days=400),
+        )
+
+    def test_ordered_subscription_plan_expirations(self):
+        """
+        Active plans are listed first, each group ordered by the latest expiration including renewals.
+        """
+        with self.assertNumQueries(1):
+            expirations = self.customer_agreement.ordered_subscription_plan_expirations
+
+        assert [expiration['uuid'] for expiration in expirations] == [
+            self.renewed_plan.uuid,
+            self.short_plan.uuid,
+            self.inactive_plan.uuid,
+        ]
+        assert expirations[0]['days_until_expiration'] == 20
+        assert expirations[0]['days_until_expiration_including_renewals'] == days_until(
+            self.renewal.renewed_expiration_date,
+        )
+
 
 class LicenseModelTests(TestCase):
     """
@@ -92,3 +441,81 @@ class LicenseModelTests(TestCase):
             assert 2 == len(license_history)
             assert self.CREATE_HISTORY_TYPE == user_license.history.earliest().history_type
             assert self.UPDATE_HISTORY_TYPE == user_license.history.first().history_type
+
+    def test_set_date_fields_to_now(self):
+        """
+        Test that set_date_fields_to_now updates every license with one query, and creates an associated
+        historical record for the update action
+        """
+        licenses = [License(subscription_plan=self.subscription_plan) for _ in range(3)]
+        License.bulk_create(licenses)
+
+        with self.assertNumQueries(2):
+            License.set_date_fields_to_now(licenses, ['assigned_date', 'last_remind_date'])
+
+        for user_license in licenses:
+            expected_date = user_license.assigned_date
+            user_license.refresh_from_db()
+            assert user_license.assigned_date == user_license.last_remind_date == expected_date
+            assert 2 == len(user_license.history.all())
+            assert self.UPDATE_HISTORY_TYPE == user_license.history.first().history_type
+            assert expected_date == user_license.history.first().last_remind_date
+
+    def test_set_date_fields_to_now_queryset(self):
+        """
+        Test that set_date_fields_to_now reads a queryset of licenses in batches, and updates each batch with one
+        query
+        """
+        subscription_plan = SubscriptionPlanFactory()
+        num_licenses = LICENSE_BULK_OPERATION_BATCH_SIZE + 1
+        subscription_plan.increase_num_licenses(num_licenses)
+
+        # One query to read the licenses, and an update and history insert per batch
+        with self.assertNumQueries(5):
+            License.set_date_fields_to_now(subscription_plan.licenses.order_by('uuid'), ['last_remind_date'])
+
+        assert subscription_plan.licenses.filter(last_remind_date__isnull=False).count() == num_licenses
+        assert License.history.filter(  # pylint: disable=no-member
+            subscription_plan=subscription_plan,
+            history_type=self.UPDATE_HISTORY_TYPE,
+            last_remind_date__isnull=False,
+        ).count() == num_licenses
+
+    def test_bulk_clear_historical_pii(self):
+        """
+        Test that bulk_clear_historical_pii removes pii from the historical records of only the given licenses, with
+        one query per batch of licenses
+        """
+        licenses = [
+            LicenseFactory(
+                subscription_plan=self.subscription_plan,
+                user_email='edx{}@example.com'.format(lms_user_id),
+                lms_user_id=lms_user_id,
+            )
+            for lms_user_id in range(3)
+        ]
+        other_license = LicenseFactory(
+            subscription_plan=self.subscription_plan,
+            user_email='other@example.com',
+            lms_user_id=3,
+        )
+
+        with self.assertNumQueries(1):
+            License.bulk_clear_historical_pii(licenses)
+
+        for user_license in licenses:
+            assert not user_license.history.filter(user_email__isnull=False).exists()
+            assert not user_license.history.filter(lms_user_id__isnull=False).exists()
+        assert other_license.history.filter(user_email='other@example.com', lms_user_id=3).exists()
+
+    def test_for_staff_serializer(self):
+        """
+        Test that the fields read by the staff license serializer are loaded with a single query
+        """
+        user_license = LicenseFactory(subscription_plan=self.subscription_plan, user_email='staff@example.com')
+
+        with self.assertNumQueries(1):
+            staff_license = License.by_user_email('staff@example.com').for_staff_serializer().get()
+            assert staff_license.subscription_plan.title == self.subscription_plan.title
+            assert staff_license.subscription_plan.expiration_date == self.subscription_plan.expiration_date
+            assert staff_license.activation_link == user_license.activation_link
@@ -1,5 +1,6 @@
 """ Utility functions for the subscriptions app. """
 from datetime import date, datetime
+from itertools import islice
 
 from django.conf import settings
 from pytz import UTC
@@ -26,6 +27,18 @@ def chunks(a_list, chunk_size):
         yield a_list[i:i + chunk_size]
 
 
+def chunked(iterable, chunk_size):
+    """
+    Helper to break any iterable up into chunks, without first loading all of it into memory. Returns a generator
+    of lists
+    """
+    iterator = iter(iterable)
+    chunk = list(islice(iterator, chunk_size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, chunk_size))
+
+
 def get_learner_portal_url(enterprise_slug):
     """
     Returns the link to the learner portal, given an enterprise slug.